@@ -0,0 +1,243 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython-accelerated LeafNode for the B+ tree hot path.
+
+This module mirrors the pure-Python ``LeafNode`` in ``bplus_tree.py``.
+``find_position``, ``insert``, ``get``, and ``delete`` run on every
+``__setitem__``/``__getitem__``/``__delitem__``, so the binary search is
+inlined here with direct ``PyList_GET_ITEM``/``PyObject_RichCompareBool``
+calls instead of going through ``bisect`` and Python method dispatch.
+
+The extension is optional: it is only built when the
+``BPLUSTREE_BUILD_CYTHON`` environment variable is set (see ``setup.py``),
+and ``bplus_tree.py`` falls back to the pure-Python class when the import
+fails. Any behavioral change to the pure-Python ``LeafNode`` must be
+mirrored here.
+"""
+
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.object cimport PyObject_RichCompareBool, Py_LT, Py_EQ
+
+# Below this size a linear scan wins over binary probing: the scan's only
+# unpredictable branch is the loop exit, and the whole node fits in L1
+cdef Py_ssize_t _LINEAR_SEARCH_MAX = 16
+
+
+cdef inline Py_ssize_t _bisect_left_inline(list keys, object key) except -1:
+    """Branchless bisect_left over a Python list (Shar's algorithm).
+
+    The probe offset walks down from the largest power of two <= n, so the
+    comparison result only conditionally advances the anchor index instead
+    of selecting a new half-range — no data-dependent branch on the search
+    path beyond the comparison itself.
+    """
+    cdef Py_ssize_t n = PyList_GET_SIZE(keys)
+    if n == 0:
+        return 0
+    cdef Py_ssize_t i
+    cdef int ge
+    if n < _LINEAR_SEARCH_MAX:
+        # Short nodes: a predictable forward scan beats binary probing
+        for i in range(n):
+            ge = PyObject_RichCompareBool(
+                <object>PyList_GET_ITEM(keys, i), key, Py_LT
+            )
+            if ge < 0:
+                return -1
+            if not ge:
+                return i
+        return n
+    cdef Py_ssize_t anchor = -1
+    cdef Py_ssize_t probe
+    cdef Py_ssize_t step = 1
+    cdef int lt
+    while (step << 1) <= n:
+        step <<= 1
+    while step > 0:
+        probe = anchor + step
+        if probe < n:
+            lt = PyObject_RichCompareBool(
+                <object>PyList_GET_ITEM(keys, probe), key, Py_LT
+            )
+            if lt < 0:
+                return -1
+            if lt:
+                anchor = probe
+        step >>= 1
+    return anchor + 1
+
+
+cdef class LeafNode:
+    """Leaf node containing key-value pairs (compiled variant).
+
+    Drop-in replacement for the pure-Python ``LeafNode``; see
+    ``bplus_tree.py`` for the full class documentation.
+    """
+
+    cdef public int capacity
+    cdef public list keys
+    cdef public list values
+    cdef public object next
+
+    IS_LEAF = True
+
+    def __init__(self, int capacity):
+        self.capacity = capacity
+        self.keys = []
+        self.values = []
+        self.next = None
+
+    def is_leaf(self):
+        return True
+
+    cpdef bint is_full(self):
+        return PyList_GET_SIZE(self.keys) >= self.capacity
+
+    def __len__(self):
+        return PyList_GET_SIZE(self.keys)
+
+    cpdef bint is_underfull(self):
+        """Check if leaf has fewer than minimum required keys."""
+        return PyList_GET_SIZE(self.keys) < (self.capacity - 1) // 2
+
+    cpdef bint can_donate(self):
+        """Check if leaf can give a key to a sibling (has more than minimum)."""
+        return PyList_GET_SIZE(self.keys) > (self.capacity - 1) // 2
+
+    def _donation_size(self, donor):
+        """How many items to move from donor in one batched borrow."""
+        cdef Py_ssize_t min_keys = (self.capacity - 1) // 2
+        cdef Py_ssize_t surplus = len(donor.keys) - min_keys
+        cdef Py_ssize_t count = max(1, (surplus + 1) // 2)
+        return min(count, self.capacity - PyList_GET_SIZE(self.keys))
+
+    def borrow_from_left(self, left_sibling):
+        """Borrow trailing key-values from left sibling in one batched shift."""
+        if not left_sibling.can_donate():
+            raise ValueError("Left sibling cannot donate")
+
+        count = self._donation_size(left_sibling)
+        self.keys[:0] = left_sibling.keys[-count:]
+        self.values[:0] = left_sibling.values[-count:]
+        del left_sibling.keys[-count:]
+        del left_sibling.values[-count:]
+
+    def borrow_from_right(self, right_sibling):
+        """Borrow leading key-values from right sibling in one batched shift."""
+        if not right_sibling.can_donate():
+            raise ValueError("Right sibling cannot donate")
+
+        count = self._donation_size(right_sibling)
+        self.keys.extend(right_sibling.keys[:count])
+        self.values.extend(right_sibling.values[:count])
+        del right_sibling.keys[:count]
+        del right_sibling.values[:count]
+
+    def merge_with_right(self, right_sibling):
+        """Merge this leaf with its right sibling."""
+        self.keys.extend(right_sibling.keys)
+        self.values.extend(right_sibling.values)
+        self.next = right_sibling.next
+
+    cpdef tuple find_position(self, key):
+        """Find where a key should be inserted.
+
+        Returns (position, exists) where exists is True if key already exists.
+        """
+        cdef Py_ssize_t pos = _bisect_left_inline(self.keys, key)
+        cdef bint exists = (
+            pos < PyList_GET_SIZE(self.keys)
+            and PyObject_RichCompareBool(
+                <object>PyList_GET_ITEM(self.keys, pos), key, Py_EQ
+            )
+        )
+        return pos, exists
+
+    cpdef tuple insert_or_update(self, key, value):
+        """Single-bisect write primitive: update in place, or insert if room.
+
+        Returns (existed, needs_split); needs_split is True when the leaf
+        is full and the caller must split before inserting.
+        """
+        cdef Py_ssize_t pos = _bisect_left_inline(self.keys, key)
+        if pos < PyList_GET_SIZE(self.keys) and PyObject_RichCompareBool(
+            <object>PyList_GET_ITEM(self.keys, pos), key, Py_EQ
+        ):
+            self.values[pos] = value
+            return True, False
+        if PyList_GET_SIZE(self.keys) < self.capacity:
+            self.keys.insert(pos, key)
+            self.values.insert(pos, value)
+            return False, False
+        return False, True
+
+    cpdef insert(self, key, value):
+        """Insert a key-value pair. Returns old value if key exists."""
+        cdef Py_ssize_t pos = _bisect_left_inline(self.keys, key)
+        if pos < PyList_GET_SIZE(self.keys) and PyObject_RichCompareBool(
+            <object>PyList_GET_ITEM(self.keys, pos), key, Py_EQ
+        ):
+            old_value = <object>PyList_GET_ITEM(self.values, pos)
+            self.values[pos] = value
+            return old_value
+        self.keys.insert(pos, key)
+        self.values.insert(pos, value)
+        return None
+
+    cpdef get(self, key):
+        """Get value for a key, returns None if not found."""
+        cdef Py_ssize_t pos = _bisect_left_inline(self.keys, key)
+        if pos < PyList_GET_SIZE(self.keys) and PyObject_RichCompareBool(
+            <object>PyList_GET_ITEM(self.keys, pos), key, Py_EQ
+        ):
+            return <object>PyList_GET_ITEM(self.values, pos)
+        return None
+
+    cpdef delete(self, key):
+        """Delete a key, returns the value if found."""
+        cdef Py_ssize_t pos = _bisect_left_inline(self.keys, key)
+        if pos < PyList_GET_SIZE(self.keys) and PyObject_RichCompareBool(
+            <object>PyList_GET_ITEM(self.keys, pos), key, Py_EQ
+        ):
+            self.keys.pop(pos)
+            return self.values.pop(pos)
+        return None
+
+    def split(self):
+        """Split this leaf node, returning the new right node."""
+        cdef Py_ssize_t mid = PyList_GET_SIZE(self.keys) // 2
+
+        new_leaf = type(self)(self.capacity)
+        new_leaf.keys = self.keys[mid:]
+        new_leaf.values = self.values[mid:]
+        # Truncate in place: only the two right-half copies allocate
+        del self.keys[mid:]
+        del self.values[mid:]
+
+        new_leaf.next = self.next
+        self.next = new_leaf
+
+        return new_leaf
+
+    def split_and_insert(self, key, value):
+        """Split leaf and insert key-value, returning (new_leaf, separator_key)."""
+        new_leaf = self.split()
+
+        if key < new_leaf.keys[0]:
+            self.insert(key, value)
+        else:
+            new_leaf.insert(key, value)
+
+        return new_leaf, new_leaf.keys[0]
+
+    def find_leaf_for_key(self, _key):
+        """Find the leaf node that contains or would contain the given key."""
+        return self
+
+    def key_count(self):
+        """Count all keys in this leaf and all following leaves."""
+        cdef Py_ssize_t count = 0
+        node = self
+        while node is not None:
+            count += len(node.keys)
+            node = node.next
+        return count
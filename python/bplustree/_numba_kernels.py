@@ -0,0 +1,88 @@
+"""Optional Numba-compiled search kernels for typed-key leaves.
+
+When Numba and NumPy are installed, ``bisect_left`` runs the leaf binary
+search as compiled machine code over the raw int64/float64 buffer of an
+``array.array``-backed leaf, skipping the per-comparison PyObject dispatch
+of the pure-Python bisect.
+
+Like the C and Cython extensions, this module is strictly optional:
+importing it raises ImportError when Numba or NumPy is missing, and
+``bplus_tree.py`` guards the import and falls back to ``bisect``. Neither
+package is a dependency of this project.
+"""
+
+import numpy as np
+from numba import njit
+
+# Below this size a linear scan beats binary probing: the scan's only
+# unpredictable branch is the loop exit. The cutoff is higher than the
+# Cython leaf's 16 because these comparisons run on unboxed scalars, so
+# each scanned element is cheaper relative to a binary probe.
+_LINEAR_SEARCH_MAX = 32
+
+# array.array typecode -> NumPy dtype for the zero-copy buffer view
+_BUFFER_DTYPES = {"q": np.int64, "d": np.float64}
+
+
+@njit(cache=True)
+def _bisect_left_kernel(keys, key):
+    n = keys.shape[0]
+    if n < _LINEAR_SEARCH_MAX:
+        for i in range(n):
+            if keys[i] >= key:
+                return i
+        return n
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if keys[mid] < key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+@njit(cache=True)
+def _bisect_right_kernel(keys, key):
+    n = keys.shape[0]
+    if n < _LINEAR_SEARCH_MAX:
+        for i in range(n):
+            if keys[i] > key:
+                return i
+        return n
+    lo = 0
+    hi = n
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if keys[mid] <= key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def bisect_left(keys, key):
+    """bisect_left over an ``array.array('q'|'d')`` via a compiled kernel.
+
+    ``np.frombuffer`` wraps the array's buffer without copying, so the
+    kernel reads the leaf's own storage.
+    """
+    return int(
+        _bisect_left_kernel(
+            np.frombuffer(keys, dtype=_BUFFER_DTYPES[keys.typecode]), key
+        )
+    )
+
+
+def bisect_right(keys, key):
+    """bisect_right over an ``array.array('q'|'d')`` via a compiled kernel.
+
+    Used by typed branch nodes to pick the child slot on every descent
+    level without per-comparison PyObject dispatch.
+    """
+    return int(
+        _bisect_right_kernel(
+            np.frombuffer(keys, dtype=_BUFFER_DTYPES[keys.typecode]), key
+        )
+    )
@@ -89,6 +89,28 @@ if os.environ.get("BPLUSTREE_BUILD_C_EXTENSION"):
         language="c",
     )
 
+# Optional Cython-accelerated LeafNode (opt-in, mirrors the C extension gating)
+leafnode_ext = []
+if os.environ.get("BPLUSTREE_BUILD_CYTHON"):
+    from Cython.Build import cythonize
+
+    leafnode_ext = cythonize(
+        [
+            Extension(
+                "bplustree._leafnode",
+                sources=["bplustree/_leafnode.pyx"],
+                extra_compile_args=extra_compile_args,
+                extra_link_args=extra_link_args,
+                define_macros=define_macros,
+            )
+        ],
+        compiler_directives={
+            "language_level": "3",
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
 # Setup configuration
 # Note: Most metadata now comes from pyproject.toml, but setup.py still needed for C extensions
 setup(
@@ -108,7 +130,7 @@ project_urls={
         "Changelog": "https://github.com/KentBeck/BPlusTree3/blob/main/python/CHANGELOG.md",
     },
     packages=find_packages(exclude=["tests*", "examples*", "docs*"]),
-    ext_modules=[bplustree_c] if bplustree_c else [],
+    ext_modules=([bplustree_c] if bplustree_c else []) + leafnode_ext,
     include_package_data=True,
     zip_safe=False,
     python_requires=">=3.8",
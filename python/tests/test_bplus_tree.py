@@ -903,5 +903,270 @@ class TestNodeMerging:
             assert tree[key] == f"value_{key}"
 
 
+class TestRightmostLeafTracking:
+    """Test that the rightmost-leaf pointer stays valid without rescans"""
+
+    def _actual_rightmost(self, tree):
+        leaf = tree.leaves
+        while leaf.next is not None:
+            leaf = leaf.next
+        return leaf
+
+    def test_rightmost_leaf_tracked_through_splits(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(100):
+            tree[i] = f"value_{i}"
+            assert tree._rightmost_leaf is self._actual_rightmost(tree)
+
+    def test_rightmost_leaf_tracked_through_deletions(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(100):
+            tree[i] = f"value_{i}"
+
+        for i in range(99, 10, -1):
+            del tree[i]
+            assert tree._rightmost_leaf is self._actual_rightmost(tree)
+
+    def test_rightmost_leaf_after_clear(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(50):
+            tree[i] = i
+        tree.clear()
+        assert tree._rightmost_leaf is tree.leaves
+
+    def test_append_fast_path_matches_descent(self):
+        tree = BPlusTreeMap(capacity=4)
+        # Strictly increasing keys ride the append fast path end to end
+        for i in range(500):
+            tree[i] = f"value_{i}"
+
+        assert len(tree) == 500
+        assert list(tree.items()) == [(i, f"value_{i}") for i in range(500)]
+        assert check_invariants(tree)
+
+        # Out-of-order and duplicate writes still take the descent path
+        tree[250] = "updated"
+        tree[-1] = "front"
+        assert tree[250] == "updated"
+        assert tree[-1] == "front"
+        assert len(tree) == 501
+
+
+class TestLastLeafHint:
+    """Test the last-accessed-leaf hint cache stays coherent"""
+
+    def test_sequential_reads_stay_correct(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(200):
+            tree[i] = f"value_{i}"
+
+        # Repeated locality-heavy access pattern exercises the hint
+        for i in range(200):
+            assert tree[i] == f"value_{i}"
+            assert i in tree
+
+    def test_hint_not_served_from_merged_away_leaf(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(50):
+            tree[i] = f"value_{i}"
+
+        # Warm the hint on a mid-tree leaf, then force merges around it
+        assert tree[20] == "value_20"
+        for i in range(10, 35):
+            del tree[i]
+
+        for i in range(10, 35):
+            assert i not in tree
+        for i in list(range(10)) + list(range(35, 50)):
+            assert tree[i] == f"value_{i}"
+
+    def test_hint_fast_path_updates_and_inserts(self):
+        tree = BPlusTreeMap(capacity=16)
+        for i in range(0, 100, 2):
+            tree[i] = i
+
+        # Read warms the hint; in-range writes should hit the fast path
+        assert tree[50] == 50
+        tree[50] = "updated"
+        tree[51] = "inserted"
+        assert tree[50] == "updated"
+        assert tree[51] == "inserted"
+        assert len(tree) == 51
+
+
+class TestHotKeyLeafCache:
+    """Test the bounded hot-key leaf cache stays coherent"""
+
+    def test_repeated_hot_key_reads(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(500):
+            tree[i] = f"value_{i}"
+
+        # Zipfian-ish pattern: a few keys hammered repeatedly
+        for _ in range(10):
+            for key in (3, 250, 499):
+                assert tree.get(key) == f"value_{key}"
+        assert len(tree._leaf_cache) <= 64
+
+    def test_cache_cleared_by_leaf_merges(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(100):
+            tree[i] = f"value_{i}"
+        for i in range(100):
+            assert tree.get(i) == f"value_{i}"
+
+        # Deleting most keys forces leaf merges, which clear the cache
+        for i in range(10, 90):
+            del tree[i]
+        for i in range(10, 90):
+            assert tree.get(i) is None
+        for i in list(range(10)) + list(range(90, 100)):
+            assert tree.get(i) == f"value_{i}"
+
+    def test_cache_survives_updates_and_reinserts(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(200):
+            tree[i] = i
+        assert tree.get(50) == 50
+        del tree[50]
+        assert tree.get(50) is None
+        tree[50] = "back"
+        assert tree.get(50) == "back"
+
+    def test_unhashable_keys_disable_cache(self):
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(10):
+            tree[[i]] = i
+
+        assert tree.get([5]) == 5
+        assert tree._leaf_cache is None
+        assert tree.get([7]) == 7
+
+
+class TestSentinelSearch:
+    """Test the two-stage sentinel search on very wide branch nodes"""
+
+    @staticmethod
+    def _wide_branch(keys):
+        branch = BranchNode(capacity=len(keys) + 1)
+        branch.keys = list(keys)
+        branch.children = [LeafNode(4) for _ in range(len(keys) + 1)]
+        return branch
+
+    def test_matches_bisect_and_builds_sentinels(self):
+        import bisect
+
+        # Non-numeric keys bypass interpolation and exercise the sentinels
+        keys = [f"key_{i:05d}" for i in range(300)]
+        branch = self._wide_branch(keys)
+
+        # First search builds the sentinel array, later ones use it
+        assert branch.find_child_index("key_00150") == 151
+        assert branch._sentinels is not None
+        for probe in ["", "key_00000", "key_00299", "key_99999", "key_00123x"]:
+            assert branch.find_child_index(probe) == bisect.bisect_right(
+                branch.keys, probe
+            )
+
+    def test_stale_sentinels_fall_back_and_rebuild(self):
+        import bisect
+
+        branch = self._wide_branch([f"key_{i:05d}" for i in range(300)])
+        branch.find_child_index("key_00150")
+        stale = branch._sentinels
+
+        # Mutate the keys without touching the sentinel array
+        branch.keys = [f"key_{i:05d}" for i in range(5000, 5600, 2)]
+        branch.children = [LeafNode(4) for _ in range(len(branch.keys) + 1)]
+        for probe in ["key_05000", "key_05123", "key_05999", ""]:
+            assert branch.find_child_index(probe) == bisect.bisect_right(
+                branch.keys, probe
+            )
+        assert branch._sentinels is not stale
+
+
+class TestInterpolationSearch:
+    """Test interpolation-guessed child lookup on wide numeric branch nodes"""
+
+    @staticmethod
+    def _wide_branch(keys):
+        branch = BranchNode(capacity=len(keys) + 1)
+        branch.keys = list(keys)
+        branch.children = [LeafNode(4) for _ in range(len(keys) + 1)]
+        return branch
+
+    def test_matches_bisect_on_uniform_keys(self):
+        import bisect
+
+        branch = self._wide_branch(list(range(0, 1000, 10)))
+        for key in list(range(-5, 1005, 3)) + [0, 990, 999]:
+            assert branch.find_child_index(key) == bisect.bisect_right(
+                branch.keys, key
+            )
+
+    def test_matches_bisect_on_skewed_keys(self):
+        import bisect
+
+        # Heavily skewed distribution forces the guess window to miss
+        keys = sorted(set(i * i * i for i in range(80)))
+        branch = self._wide_branch(keys)
+        for key in range(0, keys[-1] + 10, 997):
+            assert branch.find_child_index(key) == bisect.bisect_right(
+                branch.keys, key
+            )
+
+    def test_float_keys(self):
+        import bisect
+
+        branch = self._wide_branch([i * 0.25 for i in range(100)])
+        for key in [0.0, 0.1, 12.5, 24.75, 30.0]:
+            assert branch.find_child_index(key) == bisect.bisect_right(
+                branch.keys, key
+            )
+
+    def test_string_keys_use_binary_search(self):
+        branch = self._wide_branch([f"key_{i:04d}" for i in range(100)])
+        assert branch.find_child_index("key_0050") == 51
+
+    def test_non_finite_keys_fall_back_to_bisect(self):
+        import bisect
+
+        branch = self._wide_branch(list(range(0, 1000, 10)))
+        for key in [float("inf"), float("-inf"), float("nan")]:
+            assert branch.find_child_index(key) == bisect.bisect_right(
+                branch.keys, key
+            )
+
+    def test_extreme_finite_keys_fall_back_to_bisect(self):
+        import bisect
+
+        # Finite keys whose span overflows float arithmetic to inf
+        branch = self._wide_branch([i * 1e306 for i in range(-50, 50)])
+        for key in [-8e307, 0.0, 8e307]:
+            assert branch.find_child_index(key) == bisect.bisect_right(
+                branch.keys, key
+            )
+
+    def test_non_finite_probes_on_numeric_tree(self):
+        tree = BPlusTreeMap(capacity=128)
+        for i in range(20000):
+            tree[i] = i
+
+        assert float("-inf") not in tree
+        assert tree.get(float("inf")) is None
+        tree[float("inf")] = "top"
+        assert tree[float("inf")] == "top"
+        del tree[float("inf")]
+        assert float("inf") not in tree
+
+    def test_end_to_end_numeric_tree(self):
+        tree = BPlusTreeMap(capacity=128)
+        for i in range(20000):
+            tree[i] = i
+        for i in range(0, 20000, 997):
+            assert tree[i] == i
+        assert check_invariants(tree)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
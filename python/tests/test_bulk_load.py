@@ -0,0 +1,71 @@
+"""
+Tests for the bottom-up bulk loader behind from_sorted_items.
+"""
+
+import pytest
+
+from bplustree.bplus_tree import BPlusTreeMap
+from ._invariant_checker import BPlusTreeInvariantChecker
+
+
+def check_invariants(tree: BPlusTreeMap) -> bool:
+    """Check all B+ tree invariants using the invariant checker."""
+    checker = BPlusTreeInvariantChecker(tree.capacity)
+    return checker.check_invariants(tree.root, tree.leaves)
+
+
+class TestBulkLoad:
+    """Test bottom-up construction from sorted items."""
+
+    @pytest.mark.parametrize("capacity", [4, 8, 128])
+    @pytest.mark.parametrize("count", [0, 1, 3, 7, 100, 1000])
+    def test_matches_incremental_insertion(self, capacity, count):
+        items = [(i, f"value_{i}") for i in range(count)]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=capacity)
+
+        assert len(tree) == count
+        assert list(tree.items()) == items
+        assert check_invariants(tree)
+
+    def test_single_leaf_root(self):
+        tree = BPlusTreeMap.from_sorted_items([(1, "a"), (2, "b")], capacity=4)
+        assert tree.root.is_leaf()
+        assert tree[1] == "a"
+
+    def test_duplicate_keys_keep_last_value(self):
+        items = [(1, "a"), (2, "b"), (2, "c"), (3, "d"), (3, "e"), (3, "f")]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=4)
+        assert list(tree.items()) == [(1, "a"), (2, "c"), (3, "f")]
+
+    def test_heavy_duplicate_input_collapses_to_last_value(self):
+        # >1000 items with long same-key runs triggers the dict collapse
+        items = [(i, f"v{i}_{j}") for i in range(300) for j in range(5)]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=8)
+        assert len(tree) == 300
+        assert all(tree[i] == f"v{i}_4" for i in range(300))
+        assert check_invariants(tree)
+
+    def test_unsorted_input_falls_back_to_incremental(self):
+        items = [(3, "c"), (1, "a"), (2, "b")]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=4)
+        assert list(tree.items()) == [(1, "a"), (2, "b"), (3, "c")]
+        assert check_invariants(tree)
+
+    def test_loaded_tree_supports_mutation(self):
+        items = [(i, i) for i in range(500)]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=8)
+
+        for i in range(0, 500, 3):
+            del tree[i]
+        for i in range(500, 600):
+            tree[i] = i
+
+        assert check_invariants(tree)
+        assert 1 in tree and 0 not in tree and 599 in tree
+
+    def test_rightmost_leaf_set_by_bulk_load(self):
+        tree = BPlusTreeMap.from_sorted_items([(i, i) for i in range(100)], capacity=4)
+        leaf = tree.leaves
+        while leaf.next is not None:
+            leaf = leaf.next
+        assert tree._rightmost_leaf is leaf
@@ -235,6 +235,41 @@ class TestDictionaryAPI:
         assert self.tree[101] == "hundred_one"
         assert self.tree[5] == "updated_five"
 
+    def test_update_with_another_tree(self):
+        """Test update() with another BPlusTreeMap (batched merge path)."""
+        other = BPlusTreeMap(capacity=8)
+        for i in range(3, 60):
+            other[i] = f"merged_{i}"
+
+        self.tree.update(other)
+
+        # Incoming values win on overlapping keys
+        for i in range(3, 60):
+            assert self.tree[i] == f"merged_{i}"
+        # Keys only in the original tree survive
+        assert self.tree[0] == "value_0"
+        assert len(self.tree) == 60
+
+    def test_update_with_small_tree(self):
+        """Test update() with a small tree (per-key insertion path)."""
+        for i in range(10, 100):
+            self.tree[i] = f"value_{i}"
+        other = BPlusTreeMap(capacity=8)
+        other[5] = "five"
+        other[50] = "fifty"
+
+        self.tree.update(other)
+
+        assert self.tree[5] == "five"
+        assert self.tree[50] == "fifty"
+        assert self.tree[51] == "value_51"
+
+    def test_update_with_empty_tree(self):
+        """Test update() with an empty BPlusTreeMap is a no-op."""
+        before = list(self.tree.items())
+        self.tree.update(BPlusTreeMap(capacity=8))
+        assert list(self.tree.items()) == before
+
     def test_copy(self):
         """Test copy() method creates a shallow copy."""
         # Create a copy
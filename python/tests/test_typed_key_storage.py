@@ -0,0 +1,135 @@
+"""
+Tests for typed key storage (key_dtype) using array.array-backed leaves.
+"""
+
+import pytest
+from array import array
+
+from bplustree.bplus_tree import (
+    BPlusTreeMap,
+    BPlusTreeError,
+    LeafNodeInt64,
+    LeafNodeFloat64,
+    BranchNodeInt64,
+)
+
+
+class TestTypedKeyStorage:
+    """Test array.array-backed leaf nodes selected via key_dtype."""
+
+    def test_int64_keys_stored_in_array(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        tree[1] = "one"
+        assert isinstance(tree.leaves, LeafNodeInt64)
+        assert isinstance(tree.leaves.keys, array)
+        assert tree.leaves.keys.typecode == "q"
+
+    def test_basic_operations_with_int64_keys(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(100):
+            tree[i] = f"value_{i}"
+
+        assert len(tree) == 100
+        for i in range(100):
+            assert tree[i] == f"value_{i}"
+
+        for i in range(0, 100, 2):
+            del tree[i]
+        assert len(tree) == 50
+        assert 2 not in tree
+        assert tree[3] == "value_3"
+
+    def test_splits_preserve_typed_leaves(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(200):
+            tree[i] = i * 10
+
+        leaf = tree.leaves
+        while leaf is not None:
+            assert isinstance(leaf, LeafNodeInt64)
+            assert isinstance(leaf.keys, array)
+            leaf = leaf.next
+
+    def test_range_queries_with_int64_keys(self):
+        tree = BPlusTreeMap(capacity=8, key_dtype="i8")
+        for i in range(50):
+            tree[i] = i
+
+        assert list(tree.keys(10, 20)) == list(range(10, 20))
+
+    def test_float64_keys(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="f8")
+        for i in range(50):
+            tree[i * 0.5] = i
+
+        assert isinstance(tree.leaves, LeafNodeFloat64)
+        assert tree[12.5] == 25
+        assert 12.25 not in tree
+
+    def test_from_sorted_items_with_key_dtype(self):
+        items = [(i, f"v{i}") for i in range(100)]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=8, key_dtype="i8")
+        assert len(tree) == 100
+        assert tree[42] == "v42"
+        assert isinstance(tree.leaves, LeafNodeInt64)
+
+    def test_copy_preserves_key_dtype(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(20):
+            tree[i] = i
+        clone = tree.copy()
+        assert clone.key_dtype == "i8"
+        assert isinstance(clone.leaves, LeafNodeInt64)
+        assert list(clone.items()) == list(tree.items())
+
+    def test_clear_preserves_key_dtype(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(20):
+            tree[i] = i
+        tree.clear()
+        assert len(tree) == 0
+        assert isinstance(tree.leaves, LeafNodeInt64)
+
+    def test_branch_nodes_use_typed_keys(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(200):
+            tree[i] = i
+
+        def walk(node):
+            if node.is_leaf():
+                return
+            assert isinstance(node, BranchNodeInt64)
+            assert isinstance(node.keys, array)
+            for child in node.children:
+                walk(child)
+
+        walk(tree.root)
+
+    def test_typed_branches_survive_rebalancing(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        for i in range(500):
+            tree[i] = i
+        # Delete enough to force branch borrows and merges at every level
+        for i in range(0, 500, 2):
+            del tree[i]
+        for i in range(100, 400):
+            tree.pop(i, None)
+
+        remaining = [i for i in range(1, 100, 2)] + [i for i in range(401, 500, 2)]
+        assert sorted(k for k, _ in tree.items()) == remaining
+        assert all(tree[k] == k for k in remaining)
+
+    def test_invalid_key_dtype_raises(self):
+        with pytest.raises(BPlusTreeError):
+            BPlusTreeMap(capacity=4, key_dtype="complex128")
+
+    def test_non_integer_key_rejected_by_typed_tree(self):
+        tree = BPlusTreeMap(capacity=4, key_dtype="i8")
+        with pytest.raises(TypeError):
+            tree["not an int"] = 1
+
+    def test_default_tree_unaffected(self):
+        tree = BPlusTreeMap(capacity=4)
+        tree["a"] = 1
+        assert isinstance(tree.leaves.keys, list)
+        assert tree["a"] == 1